@@ -1,466 +1,805 @@
-import sys
-import threading
-import requests
-from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-    QTextEdit, QLineEdit, QPushButton, QLabel, QMessageBox
-)
-from PyQt5.QtGui import QPalette, QColor, QFont
-from PyQt5.QtCore import Qt
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-import uvicorn
-from typing import Optional, Dict
-from textblob import TextBlob
-import re
-import uuid
-from datetime import datetime
-
-app = FastAPI(title="AI Therapist Sample Model", description="Mental health resource guidance API")
-
-class MentalHealthResourceGuide:
-    CONCERN_PATTERNS = {
-        "crisis_immediate": {
-            "patterns": [
-                r"(suicide|kill myself|end my life|want to die|better off dead)",
-                r"(going to hurt myself|self harm|cutting|self injury)",
-                r"(no reason to live|can't go on|end it all)"
-            ],
-            "urgency": "immediate",
-            "response_level": "crisis"
-        },
-        "depression_signs": {
-            "patterns": [
-                r"(depressed|clinical depression|major depression)",
-                r"(hopeless|worthless|empty inside)",
-                r"(can't get out of bed|no energy|no motivation)",
-                r"(losing interest|don't enjoy anything)",
-                r"(crying every day|constant sadness)",
-                r"(sleeping too much|too little|appetite changes)",
-                r"(thoughts of death|suicidal thoughts)"
-            ],
-            "urgency": "high",
-            "response_level": "professional"
-        },
-        "anxiety_signs": {
-            "patterns": [
-                r"(panic attack|anxiety attack)",
-                r"(constant worry|can't stop worrying)",
-                r"(heart racing|can't breathe|chest tight)",
-                r"(avoiding situations|too anxious to)",
-                r"(obsessive thoughts|compulsive behaviors)"
-            ],
-            "urgency": "moderate",
-            "response_level": "professional"
-        },
-        "trauma_signs": {
-            "patterns": [
-                r"(flashbacks|nightmares|ptsd)",
-                r"(traumatic memory|childhood trauma)",
-                r"(triggered|reminded of trauma)",
-                r"(dissociating|feeling numb)"
-            ],
-            "urgency": "high",
-            "response_level": "professional"
-        }
-    }
-
-    MENTAL_HEALTH_RESOURCES = {
-        "immediate_crisis": {
-            "name": "Immediate Crisis Support",
-            "description": "Available 24/7 for immediate help",
-            "resources": [
-                "Vandrevala Foundation: 9999666555",
-                "iCall: 9152987821",
-                "AASRA: 9820466726",
-                "Emergency: 112/108"
-            ]
-        },
-        "therapy_services": {
-            "name": "Professional Therapy",
-            "description": "Licensed mental health professionals",
-            "resources": [
-                "Practo - Find Psychiatrists & Therapists",
-                "Lybrate - Online Mental Health Consultations",
-                "YourDOST - Online Counseling",
-                "Manastha - Online Therapy"
-            ]
-        },
-        "depression_support": {
-            "name": "Depression Support",
-            "description": "Specialized depression resources",
-            "resources": [
-                "Fortis Stress Helpline: +91-8376804102",
-                "NIMHANS Bangalore: 080-46110007",
-                "Depression and Bipolar Support Alliance"
-            ]
-        },
-        "anxiety_support": {
-            "name": "Anxiety Support",
-            "description": "Anxiety-specific help and tools",
-            "resources": [
-                "Anxiety and Depression Association of America",
-                "Calm App for anxiety management",
-                "Headspace for mindfulness"
-            ]
-        }
-    }
-
-    def analyze_mental_health_needs(self, text: str) -> Dict:
-        detected_concerns = []
-        highest_urgency = "low"
-        for concern_type, concern_info in self.CONCERN_PATTERNS.items():
-            for pattern in concern_info["patterns"]:
-                if re.search(pattern, text.lower()):
-                    detected_concerns.append({
-                        "type": concern_type,
-                        "urgency": concern_info["urgency"],
-                        "response_level": concern_info["response_level"]
-                    })
-                    if concern_info["urgency"] == "immediate":
-                        highest_urgency = "immediate"
-                    elif concern_info["urgency"] == "high" and highest_urgency != "immediate":
-                        highest_urgency = "high"
-                    elif concern_info["urgency"] == "moderate" and highest_urgency not in ["immediate", "high"]:
-                        highest_urgency = "moderate"
-                    break
-        return {
-            "detected_concerns": detected_concerns,
-            "highest_urgency": highest_urgency,
-            "needs_immediate_help": highest_urgency == "immediate",
-            "needs_professional_help": highest_urgency in ["immediate", "high"]
-        }
-
-    def get_recommended_resources(self, analysis: Dict) -> Dict:
-        resource_categories = []
-        if analysis["needs_immediate_help"]:
-            resource_categories.extend(["immediate_crisis"])
-        if analysis["needs_professional_help"]:
-            resource_categories.append("therapy_services")
-        for concern in analysis["detected_concerns"]:
-            if concern["type"] == "depression_signs":
-                resource_categories.append("depression_support")
-            elif concern["type"] == "anxiety_signs":
-                resource_categories.append("anxiety_support")
-            elif concern["type"] == "trauma_signs":
-                resource_categories.extend(["therapy_services"])
-        unique_categories = list(set(resource_categories))
-        resources = {}
-        for category in unique_categories:
-            resources[category] = self.MENTAL_HEALTH_RESOURCES[category]
-        return resources
-
-    def create_mental_health_response(self, user_message: str, analysis: Dict, resources: Dict) -> str:
-        if analysis["needs_immediate_help"]:
-            response = "I'm deeply concerned about your safety.\n\n"
-            response += "What you're describing sounds incredibly painful, and your safety is the most important thing right now.\n\n"
-            response += "Please reach out to these crisis services immediately:\n"
-            for resource in resources.get("immediate_crisis", {}).get("resources", []):
-                response += f"• {resource}\n"
-            response += "\nYou don't have to face this alone - there are trained professionals available right now who want to help you."
-        elif analysis["needs_professional_help"]:
-            response = "Thank you for sharing this with me.\n\n"
-            response += "What you're experiencing sounds really challenging, and it takes courage to talk about it. These feelings deserve proper professional support.\n\n"
-            response += "I strongly recommend connecting with these resources:\n"
-            for category, info in resources.items():
-                if category != "immediate_crisis":
-                    response += f"\n{info['name']} - {info['description']}:\n"
-                    for resource in info["resources"]:
-                        response += f"• {resource}\n"
-            response += "\nA mental health professional can provide the proper assessment and support you deserve."
-        else:
-            response = "I hear you.\n\n"
-            response += "It sounds like you're going through a difficult time. While I'm here to listen and offer perspectives, these resources might be helpful for additional support:\n"
-            for category, info in resources.items():
-                response += f"\n{info['name']}:\n"
-                for resource in info["resources"][:2]:
-                    response += f"• {resource}\n"
-            response += "\nRemember that seeking support is a sign of strength, not weakness."
-        return response
-
-class IntegratedMentalHealthCompanion:
-    def __init__(self):
-        self.resource_guide = MentalHealthResourceGuide()
-
-    def analyze_sympathy(self, text: str) -> Dict:
-        blob = TextBlob(text)
-        polarity = round(blob.sentiment.polarity, 3)
-        subjectivity = round(blob.sentiment.subjectivity, 3)
-        negative_factor = max(0.0, -polarity)
-        raw_score = negative_factor * (1.0 + subjectivity)
-        sympathy_score = min(1.0, raw_score / 1.5)
-        if sympathy_score >= 0.66:
-            level = "high"
-        elif sympathy_score >= 0.33:
-            level = "moderate"
-        else:
-            level = "low"
-        return {
-            "polarity": polarity,
-            "subjectivity": subjectivity,
-            "sympathy_score": round(sympathy_score, 3),
-            "sympathy_level": level
-        }
-
-    def generate_comprehensive_response(self, user_message: str, session_id: str) -> Dict:
-        mental_health_analysis = self.resource_guide.analyze_mental_health_needs(user_message)
-        resources = self.resource_guide.get_recommended_resources(mental_health_analysis)
-        sympathy_analysis = self.analyze_sympathy(user_message)
-        user_lower = user_message.lower().strip()
-
-        if any(greet in user_lower for greet in [
-            "hi", "hello", "hey", "greetings", "good morning", "good evening", "good afternoon"
-        ]):
-            base_response = (
-                "Hello! 👋 It’s so nice to connect with you. How are you feeling today? "
-                "You can share anything on your mind, and I’m here to listen with care."
-            )
-            response_type = "greeting"
-            full_response = f"{base_response}"
-       
-        elif any(word in user_lower for word in [
-            "happy", "joyful", "joy", "glad", "content", "cheerful", "delighted", "pleased", "excited"
-        ]):
-            base_response = (
-                "It’s wonderful to hear that you’re feeling happy! Celebrating these moments of joy is so important. "
-                "May your days be filled with many more such moments."
-            )
-            response_type = "happy_support"
-            full_response = f"{base_response}"
-        
-        else:
-            if any(word in user_lower for word in ["sad", "depressed", "hopeless", "empty", "can't get out of bed", "blue", "down"]):
-                base_response = (
-                    "I hear the profound sadness in your words. Remember, even in dark moments, "
-                    "there is hope for renewal. Your feelings are valid and you are not alone."
-                )
-                response_type = "depression_support"
-            elif any(word in user_lower for word in ["anxious", "worried", "panic", "overwhelmed", "stress", "nervous", "tense"]):
-                base_response = (
-                    "Anxiety can feel overwhelming, but you're showing strength by speaking about it. "
-                    "Sometimes, just acknowledging these feelings is the first step to calming your mind."
-                )
-                response_type = "anxiety_support"
-            elif any(word in user_lower for word in ["lonely", "isolated", "alone", "abandoned"]):
-                base_response = (
-                    "Feeling alone is tough. Remember, connection is possible and you are valued. "
-                    "Reaching out takes courage, and I’m here to listen."
-                )
-                response_type = "loneliness_support"
-            elif any(word in user_lower for word in ["angry", "frustrated", "mad", "irritated"]):
-                base_response = (
-                    "Anger is a natural emotion. It can be a signal that something important needs attention. "
-                    "It's okay to feel this way, and expressing it can help bring clarity and relief."
-                )
-                response_type = "anger_support"
-            elif any(word in user_lower for word in ["grateful", "thankful", "blessed"]):
-                base_response = (
-                    "Gratitude brings light into our lives. Thank you for sharing your positive feelings; "
-                    "celebrating these moments is an important part of well-being."
-                )
-                response_type = "gratitude_support"
-            elif any(word in user_lower for word in ["hopeful", "optimistic", "encouraged"]):
-                base_response = (
-                    "It’s wonderful to sense your hope and optimism. These feelings can be a guiding light "
-                    "on your path toward healing and growth."
-                )
-                response_type = "hope_support"
-            elif any(word in user_lower for word in ["dream", "dreamt", "dreamed", "nightmare"]):
-                base_response = (
-                    "Dreams are voices from your unconscious. In Jungian psychology, exploring them can open "
-                    "new ways to understand your inner self."
-                )
-                response_type = "dream_analysis"
-            elif any(word in user_lower for word in ["trauma", "flashback", "ptsd", "nightmare"]):
-                base_response = (
-                    "What you've experienced is deeply impactful. Healing takes time and support, and Jung believed "
-                    "in the psyche's capacity to mend itself."
-                )
-                response_type = "trauma_support"
-            else:
-                base_response = (
-                    "Thank you for sharing with me. I’m here to hold space for your journey and help you find the "
-                    "support that suits your needs."
-                )
-                response_type = "general_support"
-
-            empathy_preface = ""
-            if sympathy_analysis["sympathy_level"] == "high":
-                empathy_preface = (
-                    "I want you to know I’m truly sorry you’re going through this. You are not alone.\n\n"
-                )
-            elif sympathy_analysis["sympathy_level"] == "moderate":
-                empathy_preface = "I can hear that this is tough for you, and I’m here to support you.\n\n"
-
-            resource_response = self.resource_guide.create_mental_health_response(user_message, mental_health_analysis, resources)
-            full_response = f"{empathy_preface}{base_response}\n\n{resource_response}"
-
-        return {
-            "response_type": response_type,
-            "message": full_response,
-            "mental_health_analysis": mental_health_analysis,
-            "resources_provided": resources,
-            "sympathy_analysis": sympathy_analysis
-        }
-
-class MentalHealthMessage(BaseModel):
-    message: str
-    session_id: Optional[str] = None
-
-companion_system = IntegratedMentalHealthCompanion()
-
-@app.get("/")
-def home():
-    return {
-        "message": "Jungian Mental Health Guide API",
-        "version": "4.0",
-        "description": "Ethical mental health resource guidance with Jungian psychological support",
-        "endpoints": {
-            "start_session": "POST /start-mental-health-journey",
-            "chat": "POST /mental-health-guide",
-            "resources": "GET /mental-health-resources"
-        }
-    }
-
-@app.post("/start-mental-health-journey")
-def start_mental_health_session():
-    session_id = str(uuid.uuid4())[:8]
-    return {
-        "session_id": session_id,
-        "message": "Welcome to your Mental Health Companion",
-        "guide_description": "I'm here to help you find appropriate mental health resources while offering psychological perspectives.",
-        "instructions": "Use this session_id in all future messages to continue our conversation"
-    }
-
-@app.post("/mental-health-guide")
-def mental_health_guided_chat(message: MentalHealthMessage):
-    if not message.session_id:
-        raise HTTPException(status_code=400, detail="Please start with /start-mental-health-journey first")
-    user_message = message.message.strip()
-    if not user_message:
-        raise HTTPException(status_code=400, detail="Message cannot be empty")
-    response_data = companion_system.generate_comprehensive_response(user_message, message.session_id)
-    return {
-        "session_id": message.session_id,
-        "response_type": response_data["response_type"],
-        "companion_response": response_data["message"],
-        "mental_health_analysis": response_data["mental_health_analysis"],
-        "resources_provided": response_data["resources_provided"],
-        "sympathy_analysis": response_data["sympathy_analysis"],
-        "safety_note": "This system provides resource guidance, not medical treatment. Always consult healthcare professionals for medical concerns."
-    }
-
-@app.get("/mental-health-resources")
-def get_all_resources():
-    guide = MentalHealthResourceGuide()
-    return {
-        "resource_categories": guide.MENTAL_HEALTH_RESOURCES,
-        "last_updated": datetime.now().strftime("%Y-%m-%d"),
-        "note": "Always verify resources are current before use"
-    }
-
-def run_api():
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-
-class MentalHealthChat(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.session_id = None
-        self.init_ui()
-        self.start_session()
-
-    def init_ui(self):
-        self.setWindowTitle("🦚 Jungian Mental Health Companion")
-        self.setMinimumSize(620, 500)
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor("#1E3557"))  
-        self.setPalette(palette)
-
-        layout = QVBoxLayout()
-        greeting = QLabel("🦚 Welcome! Share how you feel below. Your words are safe here.")
-        greeting.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        greeting.setStyleSheet("color: #FFE66D; margin-bottom: 12px;")
-        greeting.setAlignment(Qt.AlignCenter)
-        layout.addWidget(greeting)
-
-        self.conversation = QTextEdit()
-        self.conversation.setReadOnly(True)
-        self.conversation.setFont(QFont("Segoe UI", 11))
-        self.conversation.setStyleSheet("""
-            background: #A0DED6;
-            border-radius: 12px;
-            border: 1.5px solid #4B295A;
-            padding: 10px;
-            color: #112D32;
-        """)
-        layout.addWidget(self.conversation)
-
-        input_layout = QHBoxLayout()
-        self.input_line = QLineEdit()
-        self.input_line.setPlaceholderText("Type your feelings or questions here...")
-        self.input_line.setFont(QFont("Segoe UI", 11))
-        self.input_line.setStyleSheet("""
-            background: #B0FFF7;
-            border: 1.5px solid #4B295A;
-            border-radius: 8px;
-            padding: 6px;
-            color: #1E3557;
-        """)
-        input_layout.addWidget(self.input_line)
-        self.input_line.returnPressed.connect(self.send_message)  
-
-        send_btn = QPushButton("🦚 Send")
-        send_btn.setFont(QFont("Segoe UI", 10, QFont.Bold))
-        send_btn.setStyleSheet("""
-            background-color: #FFE66D;
-            color: #1E3557;
-            border: none;
-            border-radius: 8px;
-            padding: 8px 18px;
-        """)
-        send_btn.clicked.connect(self.send_message)
-        input_layout.addWidget(send_btn)
-
-        layout.addLayout(input_layout)
-        self.setLayout(layout)
-
-    def start_session(self):
-        try:
-            resp = requests.post("http://localhost:8000/start-mental-health-journey")
-            if resp.ok:
-                data = resp.json()
-                self.session_id = data['session_id']
-                self.conversation.append("🟢 Session started.\n")
-            else:
-                self.conversation.append("Failed to start session.\n")
-        except Exception:
-            self.error_box("Could not connect to backend.")
-
-    def send_message(self):
-        user_text = self.input_line.text()
-        if not user_text.strip():
-            return
-        self.conversation.append(f"🧑‍💻 You: {user_text}")
-        self.input_line.clear()
-        payload = {'message': user_text, 'session_id': self.session_id}
-        try:
-            resp = requests.post("http://localhost:8000/mental-health-guide", json=payload)
-            if resp.ok:
-                data = resp.json()
-                companion_msg = data['companion_response']
-                self.conversation.append(f"💬 Companion:\n{companion_msg}\n")
-            else:
-                self.conversation.append("Error from API: " + resp.text)
-        except Exception:
-            self.error_box("Could not send message to backend.")
-
-    def error_box(self, msg):
-        QMessageBox.critical(self, "Error", msg)
-
-if __name__ == '__main__':
-    api_thread = threading.Thread(target=run_api, daemon=True)
-    api_thread.start()
-    app_gui = QApplication(sys.argv)
-    chat_app = MentalHealthChat()
-    chat_app.show()
-    sys.exit(app_gui.exec_())
+import sys
+import anyio.to_thread
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, constr
+import uvicorn
+from functools import lru_cache
+from typing import Optional, Dict, Final, Tuple
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+import re
+import secrets
+from datetime import date
+
+# RE2 compiles to a DFA and matches in time linear in the input with no
+# pathological backtracking, so the combined user-input scans prefer it when
+# installed; everything here stays within RE2's supported syntax. stdlib re
+# remains the fallback and keeps serving the rest of the module.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+def _compile_ci(pattern: str):
+    """Case-insensitive compile on the active engine. google-re2 takes an
+    Options object rather than stdlib flags, so the two paths differ; any
+    compile failure falls back to stdlib re."""
+    if _re is not re:
+        try:
+            options = _re.Options()
+            options.case_sensitive = False
+            return _re.compile(pattern, options=options)
+        except (AttributeError, TypeError, _re.error):
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
+# Hyperscan JIT-compiles the whole pattern set into one SIMD-accelerated
+# scanner that reports every match in a single pass. Optional like re2; the
+# combined regex remains the fallback.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Aho-Corasick walks one DFA over the message and reports every keyword hit —
+# the concern patterns are pure literal alternations, so nothing regex-shaped
+# is lost by flattening them. Optional, like the other engines.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+def _build_concern_automaton(concern_patterns):
+    """Flatten each concern alternation into literal keywords tagged with
+    their concern type and compile one Aho-Corasick automaton, or None when
+    pyahocorasick is not installed."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for concern_type, info in concern_patterns.items():
+        for pattern in info["patterns"]:
+            for keyword in pattern.strip("()").split("|"):
+                automaton.add_word(keyword, concern_type)
+    automaton.make_automaton()
+    return automaton
+
+def _build_concern_db(concern_patterns):
+    """Compile all concern patterns into one Hyperscan database.
+
+    Returns (db, types) where types maps pattern id -> concern type, or
+    (None, ()) when hyperscan is not installed.
+    """
+    if hyperscan is None:
+        return None, ()
+    expressions, ids, types = [], [], []
+    for concern_type, info in concern_patterns.items():
+        for pattern in info["patterns"]:
+            ids.append(len(types))
+            types.append(concern_type)
+            expressions.append(pattern.encode())
+    db = hyperscan.Database()
+    db.compile(
+        expressions=expressions,
+        ids=ids,
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(expressions),
+    )
+    return db, tuple(types)
+
+app = FastAPI(
+    title="AI Therapist Sample Model",
+    description="Mental health resource guidance API",
+    default_response_class=ORJSONResponse,
+)
+
+# Concern and response type tags ride along in every analysis dict and JSON
+# payload; interned, they compare by pointer and concurrent in-flight
+# responses share one copy instead of many.
+CRISIS_IMMEDIATE = sys.intern("crisis_immediate")
+DEPRESSION_SIGNS = sys.intern("depression_signs")
+ANXIETY_SIGNS = sys.intern("anxiety_signs")
+TRAUMA_SIGNS = sys.intern("trauma_signs")
+GENERAL_SUPPORT = sys.intern("general_support")
+
+class MentalHealthResourceGuide:
+    # All state lives on the class, so instances carry no __dict__ at all.
+    __slots__ = ()
+
+    # Raw pattern strings: the single source every matching engine below
+    # compiles exactly once at import time.
+    CONCERN_PATTERNS = {
+        CRISIS_IMMEDIATE: {
+            "patterns": [
+                r"(suicide|kill myself|end my life|want to die|better off dead)",
+                r"(going to hurt myself|self harm|cutting|self injury)",
+                r"(no reason to live|can't go on|end it all)"
+            ],
+            "urgency": "immediate",
+            "response_level": "crisis"
+        },
+        DEPRESSION_SIGNS: {
+            "patterns": [
+                r"(depressed|clinical depression|major depression)",
+                r"(hopeless|worthless|empty inside)",
+                r"(can't get out of bed|no energy|no motivation)",
+                r"(losing interest|don't enjoy anything)",
+                r"(crying every day|constant sadness)",
+                r"(sleeping too much|too little|appetite changes)",
+                r"(thoughts of death|suicidal thoughts)"
+            ],
+            "urgency": "high",
+            "response_level": "professional"
+        },
+        ANXIETY_SIGNS: {
+            "patterns": [
+                r"(panic attack|anxiety attack)",
+                r"(constant worry|can't stop worrying)",
+                r"(heart racing|can't breathe|chest tight)",
+                r"(avoiding situations|too anxious to)",
+                r"(obsessive thoughts|compulsive behaviors)"
+            ],
+            "urgency": "moderate",
+            "response_level": "professional"
+        },
+        TRAUMA_SIGNS: {
+            "patterns": [
+                r"(flashbacks|nightmares|ptsd)",
+                r"(traumatic memory|childhood trauma)",
+                r"(triggered|reminded of trauma)",
+                r"(dissociating|feeling numb)"
+            ],
+            "urgency": "high",
+            "response_level": "professional"
+        }
+    }
+
+    # Urgency ladder as integer ranks so matches fold with a single max().
+    _URGENCY_RANK = {"low": 0, "moderate": 1, "high": 2, "immediate": 3}
+    _RANK_TO_URGENCY = ("low", "moderate", "high", "immediate")
+
+    # All concern patterns folded into one alternation so each request scans
+    # the text exactly once; the named group identifies the concern type.
+    # Inner capture groups become non-capturing so lastgroup stays reliable.
+    _COMBINED_RE = _compile_ci(
+        "|".join(
+            "(?P<%s>%s)" % (
+                concern_type,
+                "|".join(p.replace("(", "(?:") for p in info["patterns"]),
+            )
+            for concern_type, info in CONCERN_PATTERNS.items()
+        )
+    )
+
+    _HS_DB, _HS_TYPES = _build_concern_db(CONCERN_PATTERNS)
+    _AC = _build_concern_automaton(CONCERN_PATTERNS)
+
+    MENTAL_HEALTH_RESOURCES = {
+        "immediate_crisis": {
+            "name": "Immediate Crisis Support",
+            "description": "Available 24/7 for immediate help",
+            "resources": [
+                "Vandrevala Foundation: 9999666555",
+                "iCall: 9152987821",
+                "AASRA: 9820466726",
+                "Emergency: 112/108"
+            ]
+        },
+        "therapy_services": {
+            "name": "Professional Therapy",
+            "description": "Licensed mental health professionals",
+            "resources": [
+                "Practo - Find Psychiatrists & Therapists",
+                "Lybrate - Online Mental Health Consultations",
+                "YourDOST - Online Counseling",
+                "Manastha - Online Therapy"
+            ]
+        },
+        "depression_support": {
+            "name": "Depression Support",
+            "description": "Specialized depression resources",
+            "resources": [
+                "Fortis Stress Helpline: +91-8376804102",
+                "NIMHANS Bangalore: 080-46110007",
+                "Depression and Bipolar Support Alliance"
+            ]
+        },
+        "anxiety_support": {
+            "name": "Anxiety Support",
+            "description": "Anxiety-specific help and tools",
+            "resources": [
+                "Anxiety and Depression Association of America",
+                "Calm App for anxiety management",
+                "Headspace for mindfulness"
+            ]
+        }
+    }
+
+    # Extra resource category per detected concern, replacing an if/elif chain.
+    _CONCERN_TO_CATEGORY = {
+        DEPRESSION_SIGNS: "depression_support",
+        ANXIETY_SIGNS: "anxiety_support",
+        TRAUMA_SIGNS: "therapy_services",
+    }
+
+    # Bullet lines per category depend only on the static resource data, so
+    # render them once at class load instead of re-formatting per response.
+    _RENDERED_BULLETS = {
+        category: "".join("• %s\n" % resource for resource in info["resources"])
+        for category, info in MENTAL_HEALTH_RESOURCES.items()
+    }
+
+    # The general branch lists only the first two resources per category, so
+    # that truncated block is rendered ahead of time too.
+    _RENDERED_BULLETS_TOP2 = {
+        category: "".join("• %s\n" % resource for resource in info["resources"][:2])
+        for category, info in MENTAL_HEALTH_RESOURCES.items()
+    }
+
+    def _matched_concern_types(self, text: str) -> Dict[str, None]:
+        """Concern types present in the text, deduplicated in match order."""
+        if self._HS_DB is not None:
+            hits = []
+            self._HS_DB.scan(
+                text.encode(),
+                match_event_handler=lambda pat_id, start, end, flags, ctx=None: hits.append(pat_id),
+            )
+            return dict.fromkeys(self._HS_TYPES[pat_id] for pat_id in hits)
+        if self._AC is not None:
+            # Callers pass already-lowered text; the guard keeps this path
+            # correct for any that do not, without re-copying when they do.
+            if not text.islower():
+                text = text.lower()
+            return dict.fromkeys(concern_type for _, concern_type in self._AC.iter(text))
+        return dict.fromkeys(sys.intern(match.lastgroup) for match in self._COMBINED_RE.finditer(text))
+
+    # The analysis depends only on the message (all matcher state is
+    # class-level), so repeats skip the scan entirely. Callers treat the
+    # returned dict as read-only.
+    @lru_cache(maxsize=1024)
+    def analyze_mental_health_needs(self, text: str) -> Dict[str, object]:
+        detected_concerns = []
+        highest_rank = 0
+        for concern_type in self._matched_concern_types(text):
+            concern_info = self.CONCERN_PATTERNS[concern_type]
+            detected_concerns.append({
+                "type": concern_type,
+                "urgency": concern_info["urgency"],
+                "response_level": concern_info["response_level"]
+            })
+            highest_rank = max(highest_rank, self._URGENCY_RANK[concern_info["urgency"]])
+        highest_urgency = self._RANK_TO_URGENCY[highest_rank]
+        return {
+            "detected_concerns": detected_concerns,
+            "highest_urgency": highest_urgency,
+            "needs_immediate_help": highest_rank >= self._URGENCY_RANK["immediate"],
+            "needs_professional_help": highest_rank >= self._URGENCY_RANK["high"]
+        }
+
+    def get_recommended_resources(self, analysis: Dict[str, object]) -> Dict[str, Dict]:
+        # Accumulate straight into a set — no intermediate list to dedupe —
+        # and emit in the fixed MENTAL_HEALTH_RESOURCES order so the response
+        # layout stays stable across requests.
+        categories = set()
+        if analysis["needs_immediate_help"]:
+            categories.add("immediate_crisis")
+        if analysis["needs_professional_help"]:
+            categories.add("therapy_services")
+        for concern in analysis["detected_concerns"]:
+            category = self._CONCERN_TO_CATEGORY.get(concern["type"])
+            if category:
+                categories.add(category)
+        return {
+            category: self.MENTAL_HEALTH_RESOURCES[category]
+            for category in self.MENTAL_HEALTH_RESOURCES
+            if category in categories
+        }
+
+    def create_mental_health_response(self, user_message: str, analysis: Dict[str, object], resources: Dict[str, Dict]) -> str:
+        if analysis["needs_immediate_help"]:
+            return CRISIS_RESPONSE
+        parts = []
+        if analysis["needs_professional_help"]:
+            parts.append(PROFESSIONAL_PREFIX)
+            for category, info in resources.items():
+                if category != "immediate_crisis":
+                    parts.append(f"\n{info['name']} - {info['description']}:\n")
+                    parts.append(self._RENDERED_BULLETS[category])
+            parts.append(PROFESSIONAL_SUFFIX)
+        else:
+            parts.append(GENERAL_PREFIX)
+            for category, info in resources.items():
+                parts.append(f"\n{info['name']}:\n")
+                parts.append(self._RENDERED_BULLETS_TOP2[category])
+            parts.append(GENERAL_SUFFIX)
+        return "".join(parts)
+
+# The prose around each response branch never changes, and the crisis bullet
+# list is static data, so the whole crisis reply freezes into one template at
+# import; the other branches keep only their dynamic per-category middle.
+CRISIS_RESPONSE: Final[str] = (
+    "I'm deeply concerned about your safety.\n\n"
+    "What you're describing sounds incredibly painful, and your safety is the most important thing right now.\n\n"
+    "Please reach out to these crisis services immediately:\n"
+    + MentalHealthResourceGuide._RENDERED_BULLETS["immediate_crisis"]
+    + "\nYou don't have to face this alone - there are trained professionals available right now who want to help you."
+)
+
+PROFESSIONAL_PREFIX: Final[str] = (
+    "Thank you for sharing this with me.\n\n"
+    "What you're experiencing sounds really challenging, and it takes courage to talk about it. These feelings deserve proper professional support.\n\n"
+    "I strongly recommend connecting with these resources:\n"
+)
+
+PROFESSIONAL_SUFFIX: Final[str] = "\nA mental health professional can provide the proper assessment and support you deserve."
+
+GENERAL_PREFIX: Final[str] = (
+    "I hear you.\n\n"
+    "It sounds like you're going through a difficult time. While I'm here to listen and offer perspectives, these resources might be helpful for additional support:\n"
+)
+
+GENERAL_SUFFIX: Final[str] = "\nRemember that seeking support is a sign of strength, not weakness."
+
+# Keyword lists per response category, in priority order. They are folded into
+# one compiled alternation so picking a response type is a single scan instead
+# of one substring pass per keyword. The leading \b stops "hi"-style keywords
+# from firing inside unrelated words while still matching inflected forms
+# ("dreams", "stressed"). "nightmare" lives only in dream_analysis now; the
+# old cascade could never reach it under trauma_support anyway.
+KEYWORD_CATEGORIES = {
+    "happy_support": ["happy", "joyful", "joy", "glad", "content", "cheerful", "delighted", "pleased", "excited"],
+    "depression_support": ["sad", "depressed", "hopeless", "empty", "can't get out of bed", "blue", "down"],
+    "anxiety_support": ["anxious", "worried", "panic", "overwhelmed", "stress", "nervous", "tense"],
+    "loneliness_support": ["lonely", "isolated", "alone", "abandoned"],
+    "anger_support": ["angry", "frustrated", "mad", "irritated"],
+    "gratitude_support": ["grateful", "thankful", "blessed"],
+    "hope_support": ["hopeful", "optimistic", "encouraged"],
+    "dream_analysis": ["dream", "dreamt", "dreamed", "nightmare"],
+    "trauma_support": ["trauma", "flashback", "ptsd"],
+}
+
+KEYWORD_RE = _re.compile(
+    "|".join(
+        "(?P<%s>\\b(?:%s))" % (category, "|".join(map(re.escape, words)))
+        for category, words in KEYWORD_CATEGORIES.items()
+    )
+)
+
+def _build_keyword_automaton(keyword_categories):
+    """One Aho-Corasick automaton over every response keyword, tagged with
+    (category, keyword length), or None when pyahocorasick is not installed."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for category, words in keyword_categories.items():
+        for word in words:
+            automaton.add_word(word, (category, len(word)))
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AC = _build_keyword_automaton(KEYWORD_CATEGORIES)
+
+# Categories rank by their KEYWORD_CATEGORIES position, like the original
+# cascade — a depression keyword anywhere in the text beats an anxiety
+# keyword that happens to appear earlier.
+_CATEGORY_ORDER = tuple(KEYWORD_CATEGORIES)
+_CATEGORY_RANK = {category: rank for rank, category in enumerate(_CATEGORY_ORDER)}
+
+def _match_response_type(user_lower: str) -> str:
+    """Highest-priority response category with a keyword in the text, or
+    general_support. One automaton walk when pyahocorasick is installed; the
+    combined keyword regex is the fallback. Either way the full text is
+    scanned and the best category wins, not the leftmost match."""
+    best = len(_CATEGORY_ORDER)
+    if _KEYWORD_AC is not None:
+        for end, (category, length) in _KEYWORD_AC.iter(user_lower):
+            start = end - length + 1
+            # Same left word boundary the regex enforces with \b.
+            if start == 0 or not user_lower[start - 1].isalnum():
+                rank = _CATEGORY_RANK[category]
+                if rank < best:
+                    best = rank
+                    if best == 0:
+                        break
+    else:
+        for match in KEYWORD_RE.finditer(user_lower):
+            rank = _CATEGORY_RANK[match.lastgroup]
+            if rank < best:
+                best = rank
+                if best == 0:
+                    break
+    if best == len(_CATEGORY_ORDER):
+        return GENERAL_SUPPORT
+    return _CATEGORY_ORDER[best]
+
+# Greetings are checked as whole tokens against frozensets: O(1) hash lookups
+# per token, and unlike the old substring scan they cannot fire on "hi"
+# inside "this". Two-word greetings keep a tiny substring pass of their own.
+GREETINGS = frozenset({"hi", "hello", "hey", "greetings"})
+GREET_BIGRAMS = ("good morning", "good evening", "good afternoon")
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+# Response types that stand alone, without the empathy preface and resource
+# guidance appended.
+STANDALONE_RESPONSE_TYPES = ("greeting", "happy_support")
+
+RESPONSES = {
+    "greeting": (
+        "Hello! 👋 It’s so nice to connect with you. How are you feeling today? "
+        "You can share anything on your mind, and I’m here to listen with care."
+    ),
+    "happy_support": (
+        "It’s wonderful to hear that you’re feeling happy! Celebrating these moments of joy is so important. "
+        "May your days be filled with many more such moments."
+    ),
+    "depression_support": (
+        "I hear the profound sadness in your words. Remember, even in dark moments, "
+        "there is hope for renewal. Your feelings are valid and you are not alone."
+    ),
+    "anxiety_support": (
+        "Anxiety can feel overwhelming, but you're showing strength by speaking about it. "
+        "Sometimes, just acknowledging these feelings is the first step to calming your mind."
+    ),
+    "loneliness_support": (
+        "Feeling alone is tough. Remember, connection is possible and you are valued. "
+        "Reaching out takes courage, and I’m here to listen."
+    ),
+    "anger_support": (
+        "Anger is a natural emotion. It can be a signal that something important needs attention. "
+        "It's okay to feel this way, and expressing it can help bring clarity and relief."
+    ),
+    "gratitude_support": (
+        "Gratitude brings light into our lives. Thank you for sharing your positive feelings; "
+        "celebrating these moments is an important part of well-being."
+    ),
+    "hope_support": (
+        "It’s wonderful to sense your hope and optimism. These feelings can be a guiding light "
+        "on your path toward healing and growth."
+    ),
+    "dream_analysis": (
+        "Dreams are voices from your unconscious. In Jungian psychology, exploring them can open "
+        "new ways to understand your inner self."
+    ),
+    "trauma_support": (
+        "What you've experienced is deeply impactful. Healing takes time and support, and Jung believed "
+        "in the psyche's capacity to mend itself."
+    ),
+    "general_support": (
+        "Thank you for sharing with me. I’m here to hold space for your journey and help you find the "
+        "support that suits your needs."
+    ),
+}
+
+# One guide for the whole process: the class carries no per-instance state
+# and sharing it keeps the analysis cache common to every caller.
+_RESOURCE_GUIDE = MentalHealthResourceGuide()
+
+_VADER = SentimentIntensityAnalyzer()
+
+@lru_cache(maxsize=4096)
+def _sentiment(text: str) -> Tuple[float, float]:
+    """Cached (polarity, subjectivity) for a message. VADER is a lexicon
+    engine built for short social text — far cheaper per call than TextBlob's
+    tagging pipeline — and repeated phrases ("hi", "i am sad") skip it
+    entirely after the first call."""
+    scores = _VADER.polarity_scores(text)
+    # compound lands in [-1, 1] like TextBlob polarity; the non-neutral mass
+    # stands in for subjectivity.
+    return (scores["compound"], 1.0 - scores["neu"])
+
+class IntegratedMentalHealthCompanion:
+    __slots__ = ("resource_guide",)
+
+    def __init__(self):
+        self.resource_guide = _RESOURCE_GUIDE
+
+    def analyze_sympathy(self, text: str) -> Dict[str, object]:
+        polarity, subjectivity = _sentiment(text)
+        polarity = round(polarity, 3)
+        subjectivity = round(subjectivity, 3)
+        negative_factor = max(0.0, -polarity)
+        raw_score = negative_factor * (1.0 + subjectivity)
+        sympathy_score = min(1.0, raw_score / 1.5)
+        if sympathy_score >= 0.66:
+            level = "high"
+        elif sympathy_score >= 0.33:
+            level = "moderate"
+        else:
+            level = "low"
+        return {
+            "polarity": polarity,
+            "subjectivity": subjectivity,
+            "sympathy_score": round(sympathy_score, 3),
+            "sympathy_level": level
+        }
+
+    def generate_comprehensive_response(self, user_message: str, session_id: str) -> Dict[str, object]:
+        # Lowercase once; the concern scan and the keyword dispatch share the
+        # same copy, and the analysis cache becomes case-insensitive for free.
+        user_lower = user_message.lower()
+
+        mental_health_analysis = self.resource_guide.analyze_mental_health_needs(user_lower)
+        resources = self.resource_guide.get_recommended_resources(mental_health_analysis)
+        sympathy_analysis = self.analyze_sympathy(user_message)
+
+        # Greetings first, restoring the old cascade's precedence over the
+        # emotion keywords.
+        tokens = frozenset(_TOKEN_RE.findall(user_lower))
+        if tokens & GREETINGS or any(bigram in user_lower for bigram in GREET_BIGRAMS):
+            response_type = "greeting"
+        else:
+            response_type = _match_response_type(user_lower)
+            # "nightmare" is both a dream keyword and a trauma sign; when the
+            # concern scan also flagged trauma, the trauma framing takes
+            # precedence over dream analysis.
+            if response_type == "dream_analysis" and any(
+                concern["type"] == TRAUMA_SIGNS
+                for concern in mental_health_analysis["detected_concerns"]
+            ):
+                response_type = "trauma_support"
+        base_response = RESPONSES[response_type]
+
+        if response_type in STANDALONE_RESPONSE_TYPES:
+            full_response = base_response
+        else:
+            empathy_preface = ""
+            if sympathy_analysis["sympathy_level"] == "high":
+                empathy_preface = (
+                    "I want you to know I’m truly sorry you’re going through this. You are not alone.\n\n"
+                )
+            elif sympathy_analysis["sympathy_level"] == "moderate":
+                empathy_preface = "I can hear that this is tough for you, and I’m here to support you.\n\n"
+
+            resource_response = self.resource_guide.create_mental_health_response(user_message, mental_health_analysis, resources)
+            full_response = f"{empathy_preface}{base_response}\n\n{resource_response}"
+
+        return {
+            "response_type": response_type,
+            "message": full_response,
+            "mental_health_analysis": mental_health_analysis,
+            "resources_provided": resources,
+            "sympathy_analysis": sympathy_analysis
+        }
+
+class MentalHealthMessage(BaseModel):
+    # Stripping and length bounds happen at validation time: empty or
+    # oversized input is rejected before any regex scan runs, which caps the
+    # worst-case matching cost per request.
+    message: constr(strip_whitespace=True, min_length=1, max_length=4096)
+    session_id: Optional[constr(max_length=64)] = None
+
+companion_system = IntegratedMentalHealthCompanion()
+
+@app.on_event("startup")
+async def _warm():
+    # The matching engines and the sentiment cache initialize lazily; one
+    # throwaway pass at startup keeps concurrent first requests from all
+    # paying for it at once.
+    _RESOURCE_GUIDE.analyze_mental_health_needs("ok")
+    _sentiment("ok")
+
+# The root payload never changes, so it is serialized once at import and the
+# handler returns the cached bytes.
+_ROOT_BYTES = orjson.dumps({
+    "message": "Jungian Mental Health Guide API",
+    "version": "4.0",
+    "description": "Ethical mental health resource guidance with Jungian psychological support",
+    "endpoints": {
+        "start_session": "POST /start-mental-health-journey",
+        "chat": "POST /mental-health-guide",
+        "resources": "GET /mental-health-resources"
+    }
+})
+
+@app.get("/")
+async def home():
+    return Response(content=_ROOT_BYTES, media_type="application/json")
+
+@app.post("/start-mental-health-journey")
+async def start_mental_health_session():
+    # Same 8 hex chars as the old sliced uuid4, minus the UUID
+    # formatting and version-bit work.
+    session_id = secrets.token_hex(4)
+    return {
+        "session_id": session_id,
+        "message": "Welcome to your Mental Health Companion",
+        "guide_description": "I'm here to help you find appropriate mental health resources while offering psychological perspectives.",
+        "instructions": "Use this session_id in all future messages to continue our conversation"
+    }
+
+@app.post("/mental-health-guide")
+async def mental_health_guided_chat(message: MentalHealthMessage):
+    if not message.session_id:
+        raise HTTPException(status_code=400, detail="Please start with /start-mental-health-journey first")
+    user_message = message.message
+    # The companion analysis is CPU-bound, so it stays on a worker thread
+    # while the handler itself runs on the loop.
+    response_data = await anyio.to_thread.run_sync(
+        companion_system.generate_comprehensive_response, user_message, message.session_id
+    )
+    return {
+        "session_id": message.session_id,
+        "response_type": response_data["response_type"],
+        "companion_response": response_data["message"],
+        "mental_health_analysis": response_data["mental_health_analysis"],
+        "resources_provided": response_data["resources_provided"],
+        "sympathy_analysis": response_data["sympathy_analysis"],
+        "safety_note": "This system provides resource guidance, not medical treatment. Always consult healthcare professionals for medical concerns."
+    }
+
+# The resources payload is static apart from its date stamp, so it is
+# serialized once and re-encoded only when the day rolls over.
+def _render_resources(stamp: str) -> bytes:
+    return orjson.dumps({
+        "resource_categories": MentalHealthResourceGuide.MENTAL_HEALTH_RESOURCES,
+        "last_updated": stamp,
+        "note": "Always verify resources are current before use"
+    })
+
+_resources_date = date.today().isoformat()
+_resources_bytes = _render_resources(_resources_date)
+
+@app.get("/mental-health-resources")
+async def get_all_resources():
+    global _resources_date, _resources_bytes
+    today = date.today().isoformat()
+    if today != _resources_date:
+        _resources_date = today
+        _resources_bytes = _render_resources(today)
+    return Response(content=_resources_bytes, media_type="application/json")
+
+def run_api():
+    # Runs on a background thread of the GUI process, so stick to a single
+    # worker; uvloop + httptools still replace the default loop and parser.
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools", log_level="warning")
+
+API_BASE_URL = "http://localhost:8000"
+START_SESSION_URL = API_BASE_URL + "/start-mental-health-journey"
+CHAT_URL = API_BASE_URL + "/mental-health-guide"
+
+def launch_gui():
+    """Build and run the Qt chat client.
+
+    PyQt5 and requests are imported here rather than at module top, so API
+    worker processes importing this module never pay the GUI import cost.
+    """
+    import sys
+    import requests
+    from PyQt5.QtWidgets import (
+        QApplication, QWidget, QVBoxLayout, QHBoxLayout,
+        QTextEdit, QLineEdit, QPushButton, QLabel, QMessageBox
+    )
+    from PyQt5.QtGui import QPalette, QColor, QFont
+    from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+
+    class _ChatWorkerSignals(QObject):
+        finished = pyqtSignal(str)   # companion text to append
+        failed = pyqtSignal(str)     # API error text to append
+        errored = pyqtSignal(str)    # connection failure for the error box
+
+    class _ChatWorker(QRunnable):
+        """Runs one chat POST off the GUI thread so the event loop stays live."""
+
+        def __init__(self, http, payload):
+            super().__init__()
+            self.http = http
+            self.payload = payload
+            self.signals = _ChatWorkerSignals()
+
+        def run(self):
+            try:
+                resp = self.http.post(CHAT_URL, json=self.payload, timeout=5)
+                if resp.ok:
+                    self.signals.finished.emit(resp.json()['companion_response'])
+                else:
+                    self.signals.failed.emit("Error from API: " + resp.text)
+            except Exception:
+                self.signals.errored.emit("Could not send message to backend.")
+
+    class MentalHealthChat(QWidget):
+        def __init__(self):
+            super().__init__()
+            self.session_id = None
+            # One pooled Session keeps the TCP connection alive across messages
+            # instead of a fresh handshake per requests.post call.
+            self.http = requests.Session()
+            self.init_ui()
+            self.start_session()
+
+        def init_ui(self):
+            self.setWindowTitle("🦚 Jungian Mental Health Companion")
+            self.setMinimumSize(620, 500)
+            palette = QPalette()
+            palette.setColor(QPalette.Window, QColor("#1E3557"))  
+            self.setPalette(palette)
+
+            layout = QVBoxLayout()
+            greeting = QLabel("🦚 Welcome! Share how you feel below. Your words are safe here.")
+            greeting.setFont(QFont("Segoe UI", 12, QFont.Bold))
+            greeting.setStyleSheet("color: #FFE66D; margin-bottom: 12px;")
+            greeting.setAlignment(Qt.AlignCenter)
+            layout.addWidget(greeting)
+
+            self.conversation = QTextEdit()
+            self.conversation.setReadOnly(True)
+            self.conversation.setFont(QFont("Segoe UI", 11))
+            self.conversation.setStyleSheet("""
+                background: #A0DED6;
+                border-radius: 12px;
+                border: 1.5px solid #4B295A;
+                padding: 10px;
+                color: #112D32;
+            """)
+            layout.addWidget(self.conversation)
+
+            input_layout = QHBoxLayout()
+            self.input_line = QLineEdit()
+            self.input_line.setPlaceholderText("Type your feelings or questions here...")
+            self.input_line.setFont(QFont("Segoe UI", 11))
+            self.input_line.setStyleSheet("""
+                background: #B0FFF7;
+                border: 1.5px solid #4B295A;
+                border-radius: 8px;
+                padding: 6px;
+                color: #1E3557;
+            """)
+            input_layout.addWidget(self.input_line)
+            self.input_line.returnPressed.connect(self.send_message)  
+
+            send_btn = QPushButton("🦚 Send")
+            send_btn.setFont(QFont("Segoe UI", 10, QFont.Bold))
+            send_btn.setStyleSheet("""
+                background-color: #FFE66D;
+                color: #1E3557;
+                border: none;
+                border-radius: 8px;
+                padding: 8px 18px;
+            """)
+            send_btn.clicked.connect(self.send_message)
+            input_layout.addWidget(send_btn)
+
+            layout.addLayout(input_layout)
+            self.setLayout(layout)
+
+        def start_session(self):
+            try:
+                resp = self.http.post(START_SESSION_URL, timeout=5)
+                if resp.ok:
+                    data = resp.json()
+                    self.session_id = data['session_id']
+                    self.conversation.append("🟢 Session started.\n")
+                else:
+                    self.conversation.append("Failed to start session.\n")
+            except Exception:
+                self.error_box("Could not connect to backend.")
+
+        def send_message(self):
+            user_text = self.input_line.text()
+            if not user_text.strip():
+                return
+            self.conversation.append(f"🧑‍💻 You: {user_text}")
+            self.input_line.clear()
+            payload = {'message': user_text, 'session_id': self.session_id}
+            # The POST runs on the thread pool; signals hop the result back onto
+            # the GUI thread, so conversation updates stay on the right thread.
+            worker = _ChatWorker(self.http, payload)
+            worker.signals.finished.connect(self.show_companion_response)
+            worker.signals.failed.connect(self.conversation.append)
+            worker.signals.errored.connect(self.error_box)
+            QThreadPool.globalInstance().start(worker)
+
+        def show_companion_response(self, companion_msg):
+            self.conversation.append(f"💬 Companion:\n{companion_msg}\n")
+
+        def error_box(self, msg):
+            QMessageBox.critical(self, "Error", msg)
+
+    app_gui = QApplication(sys.argv)
+    chat_app = MentalHealthChat()
+    chat_app.show()
+    sys.exit(app_gui.exec_())
+
+if __name__ == '__main__':
+    import threading
+    api_thread = threading.Thread(target=run_api, daemon=True)
+    api_thread.start()
+    launch_gui()